@@ -7,46 +7,161 @@ Webサイトをクロールしてマークダウン形式で保存するPython
 
 import argparse
 import asyncio
+import logging
 import os
+import queue
 import re
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from typing import Set, List
 import nest_asyncio
 
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+from crawl4ai import (
+    AsyncWebCrawler,
+    BrowserConfig,
+    CrawlerRunConfig,
+    CacheMode,
+    BFSDeepCrawlStrategy,
+    LXMLWebScrapingStrategy,
+)
+from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter
+
+# リンク抽出にはC実装のHTMLパーサ（lxml）を優先し、無い場合は正規表現にフォールバック
+try:
+    from lxml import html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+# HEADリクエストによる事前チェックにはhttpxを使う（無い場合はチェックをスキップ）
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# dir_fd相対のopenが使えるか（Windowsなどでは不可）
+_DIR_FD_OK = os.open in os.supports_dir_fd
+
+# 書き出したMarkdownはクロール中に読み返さないので、対応OSでは
+# ページキャッシュから追い出してメモリ圧迫を防ぐ（Linuxのみ）
+_FADV_DONTNEED = (
+    os.POSIX_FADV_DONTNEED
+    if hasattr(os, 'posix_fadvise') and hasattr(os, 'POSIX_FADV_DONTNEED')
+    else None
+)
+
+# 正規表現はモジュール読み込み時に1度だけコンパイルする
+_HREF_RE = re.compile(r'''href=["']([^"']+)["']''')
+# ASCII範囲の無効文字はC実装のstr.translateで一括置換する
+# （正規表現より短い文字列で3〜5倍程度速い）
+_BAD_FILENAME_CHARS = ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in '-_.')
+)
+_FILENAME_TRANS = str.maketrans(_BAD_FILENAME_CHARS, '-' * len(_BAD_FILENAME_CHARS))
+_BAD_QUERY_CHARS = ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in '-_=&')
+)
+_QUERY_TRANS = str.maketrans(_BAD_QUERY_CHARS, '-' * len(_BAD_QUERY_CHARS))
+# 連続ダッシュの圧縮のみ正規表現1回で行う
+_DASHES_RE = re.compile(r'-+')
+
+logger = logging.getLogger("crawler")
+
+
+def setup_logging() -> QueueListener:
+    """
+    キュー経由のロガーを初期化
+
+    ログレコードはキューに積むだけで、stdoutへの書き出しは専用スレッドが
+    行う。高並列時に各ワーカーがstdoutのロックとフラッシュで止まらない。
+
+    Returns:
+        QueueListener: 終了時にstop()を呼ぶリスナー
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    return listener
 
 
 class WebCrawler:
-    def __init__(self, start_url: str, output_dir: str = "./docs", max_depth: int = 3, css_selector: str = None, allow_query: bool = False):
+    def __init__(self, start_url: str, output_dir: str = "./docs", max_depth: int = 3, css_selector: str = None, allow_query: bool = False, refresh: bool = False, deep_crawl: bool = False):
         """
         Webクローラーを初期化
-        
+
         Args:
             start_url: 開始URL
             output_dir: 出力ディレクトリ
             max_depth: 最大クロール深度
             css_selector: 指定したCSSセレクタのDOM要素のみを抽出
             allow_query: クエリパラメータ付きURLへのアクセスを許可するかどうか
+            refresh: キャッシュを無視して全ページを再取得するかどうか
+            deep_crawl: crawl4ai組み込みのBFS深層クロールを使うかどうか
         """
         self.start_url = start_url
         self.output_dir = Path(output_dir)
         self.max_depth = max_depth
         self.css_selector = css_selector
         self.allow_query = allow_query
+        self.deep_crawl = deep_crawl
         self.visited_urls: Set[str] = set()
-        self.domain = urlparse(start_url).netloc
+
+        # start_urlのパース結果は不変なので1度だけ計算してキャッシュ
+        start_parsed = urlparse(start_url)
+        self.domain = start_parsed.netloc
+        self._start_path = start_parsed.path
+        self._start_query = start_parsed.query
+        # ドメイン+パスを連結した前方一致用プレフィックス
+        self._start_prefix = self.domain + self._start_path
+        self._crawler = None  # start_crawling中のみ有効な共有AsyncWebCrawler
+        self._http = None  # 事前チェック用の共有HTTPクライアント（接続プールを使い回す）
+        self.num_workers = 20  # 同時クロール数の上限（グローバル）
+        self._pending_writes: List[tuple] = []  # フラッシュ待ちの(url, filename, payload)
+        self._dirfd = None  # 出力ディレクトリのfd（クロール中だけ開いたまま保持）
+        self._write_batch_size = 16  # この件数たまったらまとめて書き込む
+        self._save_queue = None  # 保存要求キュー（start_crawlingで生成）
+        self._num_writer_tasks = 2  # 書き込み専用タスクの数
+        self.frontier = None  # BFSフロンティア（crawl_bfsで生成）
+        self.sem = None  # グローバル同時実行数を制限するセマフォ
         
         # 出力ディレクトリを作成
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # URLパターンフィルタ（設定されていない場合は全てのドメインを許可）
+        # 注: 最後の ".*" が全URLにマッチするため、現状はフィルタとしては素通し。
+        # パターンを絞る場合はここを編集する。
         self.allowed_patterns = [
             r".*figma\.com/plugin-docs/.*",
             r".*example\.com.*",  # テスト用
             r".*learn\.microsoft\.com.*",  # Microsoft Learn用
             r".*"  # 全てのURLを許可（汎用的な使用のため）
         ]
+        # 1本の選択（alternation）にまとめて1回のマッチで判定する
+        self._allowed_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.allowed_patterns)
+        )
+
+        # ブラウザ/クロール設定は全ページ共通なので1度だけ構築する
+        self._browser_config = BrowserConfig(
+            headless=True,
+            verbose=False
+        )
+        # デフォルトはキャッシュ利用（再クロール時に未変更ページの再取得を省く）
+        self._run_config = CrawlerRunConfig(
+            cache_mode=CacheMode.BYPASS if refresh else CacheMode.ENABLED,
+            word_count_threshold=10,
+            extraction_strategy=None,
+            chunking_strategy=None,
+            css_selector=self.css_selector,
+            screenshot=False,
+            user_agent="Mozilla/5.0 (compatible; WebCrawler/1.0)"
+        )
     
     def is_valid_url(self, url: str) -> bool:
         """
@@ -67,28 +182,27 @@ class WebCrawler:
         # クエリパラメータのチェック
         if not self.allow_query and parsed.query:
             # 開始URLと同じクエリパラメータの場合のみ許可
-            start_parsed = urlparse(self.start_url)
-            if parsed.query != start_parsed.query:
+            if parsed.query != self._start_query:
                 return False
-        
-        # ベースURL配下かチェック
-        if not parsed.path.startswith(urlparse(self.start_url).path):
+
+        # ベースURL配下かチェック（ドメイン一致確認後なので連結1回の前方一致で足りる）
+        if not (parsed.netloc + parsed.path).startswith(self._start_prefix):
             return False
         
         # URLパターンフィルタリング
-        for pattern in self.allowed_patterns:
-            if re.match(pattern, url):
-                return True
-        
-        return False
+        return bool(self._allowed_re.match(url))
     
-    def url_to_filename(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def url_to_filename(url: str) -> str:
         """
         URLをファイル名に変換
-        
+
+        純関数なので結果をLRUキャッシュし、同じURLの再変換を省く。
+
         Args:
             url: 変換するURL
-            
+
         Returns:
             str: ファイル名
         """
@@ -99,16 +213,15 @@ class WebCrawler:
             filename = "index"
         else:
             # パスをファイル名に変換
-            filename = path.replace('/', '-')
-            filename = re.sub(r'[^\w\-_.]', '-', filename)
-            filename = re.sub(r'-+', '-', filename)
+            filename = path.replace('/', '-').translate(_FILENAME_TRANS)
+            filename = _DASHES_RE.sub('-', filename)
             filename = filename.strip('-')
         
         # クエリパラメータがある場合はファイル名に追加
         if parsed.query:
             # クエリパラメータを安全なファイル名形式に変換
-            query_safe = re.sub(r'[^\w\-_=&]', '-', parsed.query)
-            query_safe = re.sub(r'-+', '-', query_safe)
+            query_safe = parsed.query.translate(_QUERY_TRANS)
+            query_safe = _DASHES_RE.sub('-', query_safe)
             query_safe = query_safe.strip('-')
             filename += f"--{query_safe}"
         
@@ -128,31 +241,74 @@ class WebCrawler:
         Returns:
             List[str]: 抽出されたリンクのリスト
         """
-        links = []
-        unique_links = set()  # 重複を防ぐためのセット
-        
+        if not content:
+            return []
+
         # HTMLからリンクを抽出
-        html_link_pattern = r'href=["\']([^"\']+)["\']'
-        matches = re.findall(html_link_pattern, content)
-        
-        for match in matches:
-            # JavaScriptリンクやメールリンクをスキップ
-            if match.startswith(('javascript:', 'mailto:', '#')):
-                continue
-                
-            full_url = urljoin(base_url, match)
-            
-            # フラグメント（#以降）を除去して重複チェック
-            clean_url = full_url.split('#')[0]
-            
-            if (self.is_valid_url(clean_url) and 
-                clean_url not in self.visited_urls and 
-                clean_url not in unique_links):
-                links.append(clean_url)
-                unique_links.add(clean_url)
-        
-        return links
+        # lxmlなら<a>タグのhrefのみを正しく拾える（コメントや<script>内を誤検出しない）
+        # 正規表現フォールバックはfinditerで逐次処理し、巨大ページでも
+        # href全件の中間リストを作らない
+        if _lxml_html is not None:
+            try:
+                tree = _lxml_html.fromstring(content)
+                matches = tree.xpath('//a[@href]/@href')
+            except Exception:
+                matches = (m.group(1) for m in _HREF_RE.finditer(content))
+        else:
+            matches = (m.group(1) for m in _HREF_RE.finditer(content))
+        
+        # 絶対URL化とフラグメント（#以降）除去を行い、setで一括重複排除
+        # （JavaScriptリンクやメールリンクはスキップ）
+        candidates = {
+            urljoin(base_url, match).split('#', 1)[0]
+            for match in matches
+            if not match.startswith(('javascript:', 'mailto:', '#'))
+        }
+
+        # 訪問済みチェック（set参照）を先に行い、既知URLには
+        # urlparse+正規表現のかかるis_valid_urlを走らせない
+        return [
+            url for url in candidates
+            if url not in self.visited_urls and self.is_valid_url(url)
+        ]
     
+    async def precheck_url(self, url: str) -> bool:
+        """
+        HEADリクエストでURLを事前チェック
+
+        404や非HTML（画像・PDFなど）をブラウザレンダリングの前に
+        安価に弾く。判定できない場合（httpx未導入、接続エラー、
+        HEAD非対応サーバーなど）はクロールを続行する。
+
+        Args:
+            url: チェックするURL
+
+        Returns:
+            bool: クロールする価値があるかどうか
+        """
+        if self._http is None:
+            return True
+
+        try:
+            response = await self._http.head(url, follow_redirects=True)
+        except Exception:
+            # 接続エラーなどの判断は本クロール側に任せる
+            return True
+
+        if response.status_code == 405:
+            # HEADを受け付けないサーバーは判定不能として通す
+            return True
+        if response.status_code != 200:
+            logger.info(f"Skipping {url}: HTTP {response.status_code}")
+            return False
+
+        content_type = response.headers.get('content-type', '')
+        if content_type and 'html' not in content_type:
+            logger.info(f"Skipping {url}: content-type {content_type}")
+            return False
+
+        return True
+
     async def crawl_page(self, url: str) -> tuple[str, List[str]]:
         """
         単一ページをクロール
@@ -163,120 +319,245 @@ class WebCrawler:
         Returns:
             tuple: (マークダウンコンテンツ, 抽出されたリンク)
         """
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False
-        )
-        
-        crawler_config = CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,
-            word_count_threshold=10,
-            extraction_strategy=None,
-            chunking_strategy=None,
-            css_selector=self.css_selector,
-            screenshot=False,
-            user_agent="Mozilla/5.0 (compatible; WebCrawler/1.0)"
-        )
-        
         try:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    config=crawler_config
-                )
-                
-                if result.success:
-                    markdown_content = result.markdown or ""
-                    links = self.extract_links(result.html or "", url)
-                    return markdown_content, links
-                else:
-                    print(f"Failed to crawl {url}: {result.error_message}")
-                    return "", []
-                    
+            result = await self._crawler.arun(
+                url=url,
+                config=self._run_config
+            )
+
+            if result.success:
+                markdown_content = result.markdown or ""
+                links = self.extract_links(result.html or "", url)
+                return markdown_content, links
+            else:
+                logger.error(f"Failed to crawl {url}: {result.error_message}")
+                return "", []
+
         except Exception as e:
-            print(f"Error crawling {url}: {str(e)}")
+            logger.error(f"Error crawling {url}: {str(e)}")
             return "", []
     
     async def save_content(self, url: str, content: str):
         """
-        コンテンツをファイルに保存
-        
+        コンテンツを保存キューに積む
+
+        実際の書き込みはバックグラウンドのライタータスクが行うため、
+        クローラー側はディスクレイテンシを待たずに次のページへ進める。
+
         Args:
             url: 元のURL
             content: マークダウンコンテンツ
         """
         filename = self.url_to_filename(url)
-        filepath = self.output_dir / filename
-        
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"# {url}\n\n")
-                f.write(content)
-            print(f"Saved: {filepath}")
-        except Exception as e:
-            print(f"Error saving {url} to {filepath}: {str(e)}")
-    
-    async def crawl_recursive(self, url: str, depth: int = 0):
+        self._save_queue.put_nowait((url, filename, f"# {url}\n\n{content}"))
+
+    async def _writer_worker(self):
         """
-        再帰的にWebサイトをクロール
-        
-        Args:
-            url: クロールするURL
-            depth: 現在の深度
+        ライター: 保存キューからページを取り出してバッチ書き込みする
+
+        1ページごとにopen/write/closeすると大量のsyscallが発生するため、
+        一定件数たまったらまとめてフラッシュする。
+        """
+        while True:
+            item = await self._save_queue.get()
+            try:
+                self._pending_writes.append(item)
+                if len(self._pending_writes) >= self._write_batch_size:
+                    await self._flush_writes()
+            finally:
+                self._save_queue.task_done()
+
+    async def _flush_writes(self):
+        """
+        保留中の書き込みを1回のスレッド呼び出しでまとめてフラッシュ
         """
-        if depth > self.max_depth or url in self.visited_urls:
+        if not self._pending_writes:
             return
-        
-        if not self.is_valid_url(url):
+        batch, self._pending_writes = self._pending_writes, []
+        await asyncio.to_thread(self._write_batch, batch)
+
+    def _write_batch(self, batch):
+        """
+        （同期）バッチ内の全ファイルを書き込む
+
+        保持済みのディレクトリfdに対する相対openでパス解決を省き、
+        ディレクトリエントリの同期もバッチごとに1回で済ませる。
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        for url, filename, payload in batch:
+            filepath = self.output_dir / filename
+            try:
+                if self._dirfd is not None:
+                    fd = os.open(filename, flags, 0o644, dir_fd=self._dirfd)
+                else:
+                    fd = os.open(filepath, flags, 0o644)
+                try:
+                    os.write(fd, payload.encode('utf-8'))
+                    if _FADV_DONTNEED is not None:
+                        # DONTNEEDが効くのは書き戻し後なので先にfsyncする
+                        os.fsync(fd)
+                        os.posix_fadvise(fd, 0, 0, _FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+                logger.info(f"Saved: {filepath}")
+            except Exception as e:
+                logger.error(f"Error saving {url} to {filepath}: {str(e)}")
+
+        if self._dirfd is not None:
+            os.fsync(self._dirfd)
+    
+    async def _worker(self):
+        """
+        ワーカー: フロンティアからURLを取り出してクロールする
+        """
+        while True:
+            url, depth = await self.frontier.get()
+            try:
+                logger.info(f"Crawling (depth {depth}): {url}")
+
+                # 軽量なHEADチェックで404や非HTMLをブラウザレンダリング前に弾く
+                if await self.precheck_url(url):
+                    # セマフォでグローバルな同時実行数を制限してページをクロール
+                    async with self.sem:
+                        content, links = await self.crawl_page(url)
+                else:
+                    content, links = "", []
+
+                if content:
+                    await self.save_content(url, content)
+
+                # デバッグ情報（リンクの内訳はDEBUGレベルでのみ出力）
+                logger.info(f"Found {len(links)} links at depth {depth}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, link in enumerate(links[:5]):  # 最初の5つのリンクを表示
+                        logger.debug(f"  Link {i+1}: {link}")
+                    if len(links) > 5:
+                        logger.debug(f"  ... and {len(links) - 5} more links")
+
+                # 見つかったリンクをフロンティアに追加
+                if depth < self.max_depth:
+                    for link in links:
+                        if link not in self.visited_urls:
+                            self.visited_urls.add(link)
+                            self.frontier.put_nowait((link, depth + 1))
+            finally:
+                self.frontier.task_done()
+
+    async def crawl_bfs(self):
+        """
+        幅優先探索（BFS）でWebサイトをクロール
+
+        フロンティアキューとワーカープールにより、ツリー全体で
+        同時実行数を一定（num_workers）に保つ。
+        """
+        if not self.is_valid_url(self.start_url):
+            logger.error(f"Invalid start URL: {self.start_url}")
             return
-        
-        print(f"Crawling (depth {depth}): {url}")
-        self.visited_urls.add(url)
-        
-        # ページをクロール
-        content, links = await self.crawl_page(url)
-        
-        if content:
-            await self.save_content(url, content)
-        
-        # デバッグ情報
-        print(f"Found {len(links)} links at depth {depth}")
-        for i, link in enumerate(links[:5]):  # 最初の5つのリンクを表示
-            print(f"  Link {i+1}: {link}")
-        if len(links) > 5:
-            print(f"  ... and {len(links) - 5} more links")
-        
-        # 見つかったリンクを再帰的にクロール
-        if depth < self.max_depth:
-            tasks = []
-            for link in links:
-                if link not in self.visited_urls:
-                    tasks.append(self.crawl_recursive(link, depth + 1))
-            
-            if tasks:
-                # 同時実行数を制限（最大10並行）
-                batch_size = 10
-                for i in range(0, len(tasks), batch_size):
-                    batch = tasks[i:i + batch_size]
-                    await asyncio.gather(*batch, return_exceptions=True)
+
+        self.frontier = asyncio.Queue()
+        self.sem = asyncio.BoundedSemaphore(self.num_workers)
+        self.visited_urls.add(self.start_url)
+        self.frontier.put_nowait((self.start_url, 0))
+
+        workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.num_workers)
+        ]
+
+        # フロンティアが空になり、全ワーカーが処理を終えるまで待機
+        await self.frontier.join()
+
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def crawl_deep(self):
+        """
+        crawl4ai組み込みのBFSDeepCrawlStrategyでクロール
+
+        探索ループ・URLフィルタ・スクレイピングをライブラリ側の
+        パイプラインに任せ、1回のarun呼び出しで完結させる。
+        """
+        strategy = BFSDeepCrawlStrategy(
+            max_depth=self.max_depth,
+            include_external=False,
+            filter_chain=FilterChain([
+                URLPatternFilter(patterns=[f"*{self.domain}{self._start_path}*"])
+            ])
+        )
+        # stream=Trueで完了したページから順次受け取る
+        # （全ページ分の結果リストをメモリに溜め込まない）
+        run_config = self._run_config.clone(
+            deep_crawl_strategy=strategy,
+            scraping_strategy=LXMLWebScrapingStrategy(),
+            stream=True
+        )
+
+        async for result in await self._crawler.arun(url=self.start_url, config=run_config):
+            self.visited_urls.add(result.url)
+            if result.success and result.markdown:
+                await self.save_content(result.url, str(result.markdown))
+            elif not result.success:
+                logger.error(f"Failed to crawl {result.url}: {result.error_message}")
     
     async def start_crawling(self):
         """
         クロールを開始
         """
-        print(f"Starting crawl from: {self.start_url}")
-        print(f"Output directory: {self.output_dir}")
-        print(f"Max depth: {self.max_depth}")
+        logger.info(f"Starting crawl from: {self.start_url}")
+        logger.info(f"Output directory: {self.output_dir}")
+        logger.info(f"Max depth: {self.max_depth}")
         if self.css_selector:
-            print(f"CSS Selector: {self.css_selector}")
-        print(f"Allow query parameters: {self.allow_query}")
-        print("-" * 50)
-        
-        await self.crawl_recursive(self.start_url)
-        
-        print("-" * 50)
-        print(f"Crawling completed. Total pages crawled: {len(self.visited_urls)}")
-        print(f"Files saved to: {self.output_dir}")
+            logger.info(f"CSS Selector: {self.css_selector}")
+        logger.info(f"Allow query parameters: {self.allow_query}")
+        logger.info("-" * 50)
+
+        # 出力ディレクトリのfdをクロール中ずっと開いたまま保持する
+        if _DIR_FD_OK:
+            self._dirfd = os.open(self.output_dir, os.O_RDONLY)
+
+        # ブラウザを1つだけ起動し、全ページで共有する（ページごとの起動コストを削減）
+        # 事前チェック用のHTTPクライアントは1つだけ作り、接続プールを共有する
+        if httpx is not None:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50),
+                headers={"User-Agent": "Mozilla/5.0 (compatible; WebCrawler/1.0)"}
+            )
+
+        async with AsyncWebCrawler(config=self._browser_config) as crawler:
+            self._crawler = crawler
+
+            # 書き込み専用タスクを起動し、ページ取得とディスク書き込みをオーバーラップさせる
+            self._save_queue = asyncio.Queue()
+            writers = [
+                asyncio.create_task(self._writer_worker())
+                for _ in range(self._num_writer_tasks)
+            ]
+
+            try:
+                if self.deep_crawl:
+                    await self.crawl_deep()
+                else:
+                    await self.crawl_bfs()
+            finally:
+                # キューに残った保存要求を処理し切ってからライターを止め、
+                # 端数のバッチも忘れずに書き出す
+                await self._save_queue.join()
+                for writer in writers:
+                    writer.cancel()
+                await asyncio.gather(*writers, return_exceptions=True)
+                await self._flush_writes()
+                self._crawler = None
+                if self._http is not None:
+                    await self._http.aclose()
+                    self._http = None
+                if self._dirfd is not None:
+                    os.close(self._dirfd)
+                    self._dirfd = None
+
+        logger.info("-" * 50)
+        logger.info(f"Crawling completed. Total pages crawled: {len(self.visited_urls)}")
+        logger.info(f"Files saved to: {self.output_dir}")
 
 
 def main():
@@ -316,6 +597,18 @@ def main():
         action="store_true",
         help="クエリパラメータ付きURLへのアクセスを許可する"
     )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="crawl4aiのキャッシュを無視して全ページを再取得する"
+    )
+
+    parser.add_argument(
+        "--deep-crawl",
+        action="store_true",
+        help="crawl4ai組み込みのBFS深層クロール（BFSDeepCrawlStrategy）を使う"
+    )
     
     args = parser.parse_args()
     
@@ -328,15 +621,21 @@ def main():
         output_dir=args.output,
         max_depth=args.max_depth,
         css_selector=args.selector,
-        allow_query=args.allow_query
+        allow_query=args.allow_query,
+        refresh=args.refresh,
+        deep_crawl=args.deep_crawl
     )
     
+    listener = setup_logging()
     try:
         asyncio.run(crawler.start_crawling())
     except KeyboardInterrupt:
-        print("\nCrawling interrupted by user.")
+        logger.info("\nCrawling interrupted by user.")
     except Exception as e:
-        print(f"Error during crawling: {str(e)}")
+        logger.error(f"Error during crawling: {str(e)}")
+    finally:
+        # キューに残ったログを吐き出してからリスナーを止める
+        listener.stop()
 
 
 if __name__ == "__main__":